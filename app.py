@@ -1,11 +1,13 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import joblib
+import logging
 from datetime import datetime, timedelta
 import time
 import random
-import hashlib
+
+from features import add_time_deltas, encode_batch
+from model_io import ModelLoadError, load_model as load_fraud_model
 
 # ==============================
 # Page Configuration
@@ -230,6 +232,8 @@ if 'is_fraud' not in st.session_state:
     st.session_state.is_fraud = False
 if 'offer_amount' not in st.session_state:
     st.session_state.offer_amount = 0
+if 'application' not in st.session_state:
+    st.session_state.application = None
 
 # ==============================
 # Load Model
@@ -237,8 +241,9 @@ if 'offer_amount' not in st.session_state:
 @st.cache_resource
 def load_model():
     try:
-        return joblib.load('Final_model.pkl')
-    except:
+        return load_fraud_model()
+    except ModelLoadError as exc:
+        logging.getLogger(__name__).error("Fraud model unavailable: %s", exc)
         return None
 
 model = load_model()
@@ -246,70 +251,59 @@ model = load_model()
 # ==============================
 # Helper Functions
 # ==============================
-def hash_to_int(value):
-    if value is None:
-        return 0
-    return int(hashlib.md5(str(value).encode()).hexdigest()[:8], 16) % 1000000
-
-def datetime_to_int(dt):
-    if isinstance(dt, pd.Timestamp):
-        return int(dt.timestamp())
-    elif isinstance(dt, datetime):
-        return int(dt.timestamp())
-    elif isinstance(dt, str):
-        try:
-            return int(pd.to_datetime(dt).timestamp())
-        except:
-            return 0
-    return 0
-
-def prepare_model_input(is_fraud_scenario):
+def build_application_record(is_fraud_scenario):
     now = datetime.now()
     
     if is_fraud_scenario:
-        input_dict = {
-            'ApplicationID': hash_to_int(f"RTL_{now.strftime('%y%m%d')}_{random.randint(1000,9999)}"),
-            'Names ClientName': hash_to_int("Fraud User"),
-            'Incident Start Date': datetime_to_int(now - timedelta(days=1)),
+        record = {
+            'ApplicationID': f"RTL_{now.strftime('%y%m%d')}_{random.randint(1000,9999)}",
+            'Names ClientName': "Fraud User",
+            'Incident Start Date': now - timedelta(hours=1),
             'Total Amounts': 250000.0,
-            'Complaint Date': datetime_to_int(now),
-            'Account Opening Date': datetime_to_int(now - timedelta(days=30)),
-            'Date of Last Password Change': datetime_to_int(now - timedelta(hours=2)),
-            'Date of Last Phone Number Change': datetime_to_int(now - timedelta(days=1)),
+            'Complaint Date': now,
+            'Account Opening Date': now - timedelta(days=30),
+            'Date of Last Password Change': now - timedelta(hours=2),
+            'Date of Last Phone Number Change': now - timedelta(days=1),
             'Phone Number': 599000000 + random.randint(100000, 999999),
-            'Email': hash_to_int("temp_fraud@gmail.com"),
-            'E-Services Login Session ID': hash_to_int(f"SES_{random.randint(100000000, 999999999)}"),
-            'Login Channel': 1,
-            'Trusted Device Status': 0,
-            'Product Type': 1,
-            'Login IP Address': hash_to_int("178.89.254.15"),
+            'Email': "temp_fraud@gmail.com",
+            'E-Services Login Session ID': f"SES_{random.randint(100000000, 999999999)}",
+            'Login Channel': "Phone Banking",
+            'Trusted Device Status': "Newly Registered",
+            'Product Type': "Retail Finance",
+            'Login IP Address': "178.89.254.15",
             'Login GPS Latitude': 11.018906,
             'Login GPS Longitude': 106.560421,
-            'Login GPS Country': 1
+            'Login GPS Country': "GFXJ+47J Ho Chi Minh, Vietnam"
         }
     else:
-        input_dict = {
-            'ApplicationID': hash_to_int(f"RTL_{now.strftime('%y%m%d')}_{random.randint(1000,9999)}"),
-            'Names ClientName': hash_to_int("Normal User"),
-            'Incident Start Date': datetime_to_int(now - timedelta(days=180)),
+        record = {
+            'ApplicationID': f"RTL_{now.strftime('%y%m%d')}_{random.randint(1000,9999)}",
+            'Names ClientName': "Normal User",
+            'Incident Start Date': now - timedelta(days=3),
             'Total Amounts': 25000.0,
-            'Complaint Date': datetime_to_int(now - timedelta(days=179)),
-            'Account Opening Date': datetime_to_int(now - timedelta(days=730)),
-            'Date of Last Password Change': datetime_to_int(now - timedelta(days=60)),
-            'Date of Last Phone Number Change': datetime_to_int(now - timedelta(days=365)),
+            'Complaint Date': now,
+            'Account Opening Date': now - timedelta(days=730),
+            'Date of Last Password Change': now - timedelta(days=60),
+            'Date of Last Phone Number Change': now - timedelta(days=365),
             'Phone Number': 579000000 + random.randint(100000, 999999),
-            'Email': hash_to_int("user_normal@yahoo.com"),
-            'E-Services Login Session ID': hash_to_int(f"SES_{random.randint(100000000, 999999999)}"),
-            'Login Channel': 0,
-            'Trusted Device Status': 1,
-            'Product Type': 0,
-            'Login IP Address': hash_to_int("139.149.137.132"),
+            'Email': "user_normal@yahoo.com",
+            'E-Services Login Session ID': f"SES_{random.randint(100000000, 999999999)}",
+            'Login Channel': "Mobile App",
+            'Trusted Device Status': "Trusted",
+            'Product Type': "Personal Finance",
+            'Login IP Address': "139.149.137.132",
             'Login GPS Latitude': 24.7136,
             'Login GPS Longitude': 46.6753,
-            'Login GPS Country': 0
+            'Login GPS Country': "MMGG+FM Al Malaz, Riyadh Saudi Arabia"
         }
     
-    return pd.DataFrame([input_dict])
+    # Time deltas are derived once here and travel with the record.
+    return add_time_deltas(pd.DataFrame([record]))
+
+def prepare_model_input(is_fraud_scenario):
+    if st.session_state.application is None:
+        st.session_state.application = build_application_record(is_fraud_scenario)
+    return encode_batch(st.session_state.application, model.feature_names)
 
 def render_stepper(current_step):
     steps_html = '<div class="stepper">'
@@ -419,6 +413,7 @@ def page_application_form():
                 }
                 st.session_state.is_fraud = (salary % 2 != 0)
                 st.session_state.offer_amount = salary * 3
+                st.session_state.application = None
                 st.session_state.page = 2
                 st.rerun()
         
@@ -678,6 +673,7 @@ def page_processing():
             st.session_state.form_data = {}
             st.session_state.is_fraud = False
             st.session_state.offer_amount = 0
+            st.session_state.application = None
             st.rerun()
         
         st.markdown('</div>', unsafe_allow_html=True)
@@ -725,6 +721,7 @@ def page_thankyou():
             st.session_state.form_data = {}
             st.session_state.is_fraud = False
             st.session_state.offer_amount = 0
+            st.session_state.application = None
             st.rerun()
         
         st.markdown('</div>', unsafe_allow_html=True)
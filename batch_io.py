@@ -0,0 +1,225 @@
+import importlib.util
+import os
+
+import numpy as np
+import pandas as pd
+
+from features import CATEGORY_LEVELS, DATE_COLUMNS, HASHED_COLUMNS, LABEL_COLUMN
+
+SUPPORTED_FORMATS = ('xlsx', 'csv', 'parquet')
+
+# Fixed Parquet column types for the workbook layout, so a chunk whose values
+# happen to be empty or numeric-looking cannot change the file schema. Dates
+# are kept as text because workbook cells mix strings and datetimes.
+PARQUET_COLUMN_TYPES = {
+    **{col: 'string' for col in HASHED_COLUMNS + list(CATEGORY_LEVELS) + DATE_COLUMNS},
+    'Total Amounts': 'float',
+    'Login GPS Latitude': 'float',
+    'Login GPS Longitude': 'float',
+    'Phone Number': 'int',
+    LABEL_COLUMN: 'int',
+}
+
+
+def detect_format(path):
+    ext = os.path.splitext(path)[1].lower().lstrip('.')
+    if ext not in SUPPORTED_FORMATS:
+        raise ValueError(f"Unsupported file format {ext!r} for {path}; expected one of {SUPPORTED_FORMATS}")
+    return ext
+
+
+# ==============================
+# Chunked Readers
+# ==============================
+def iter_xlsx_batches(path, batch_size):
+    import openpyxl
+
+    # Every sheet is read in order, so workbooks split by XlsxBatchWriter round-trip.
+    wb = openpyxl.load_workbook(path, read_only=True)
+    try:
+        header = None
+        buffer = []
+        for sheet in wb.worksheets:
+            rows = sheet.iter_rows(values_only=True)
+            sheet_header = next(rows, None)
+            if sheet_header is None:
+                continue
+            header = header or list(sheet_header)
+            for row in rows:
+                buffer.append(row)
+                if len(buffer) >= batch_size:
+                    yield pd.DataFrame(buffer, columns=header)
+                    buffer = []
+        if buffer:
+            yield pd.DataFrame(buffer, columns=header)
+    finally:
+        wb.close()
+
+def iter_csv_batches(path, batch_size):
+    yield from pd.read_csv(path, chunksize=batch_size)
+
+def _require_pyarrow():
+    if importlib.util.find_spec('pyarrow') is None:
+        raise ImportError("Parquet support needs pyarrow: pip install pyarrow")
+
+def iter_parquet_batches(path, batch_size):
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    for record_batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size):
+        yield record_batch.to_pandas()
+
+def iter_batches(path, batch_size=10000):
+    """Yield DataFrames of at most batch_size rows without loading the whole file."""
+    readers = {
+        'xlsx': iter_xlsx_batches,
+        'csv': iter_csv_batches,
+        'parquet': iter_parquet_batches,
+    }
+    return readers[detect_format(path)](path, batch_size)
+
+
+# ==============================
+# Streaming Writers
+# ==============================
+def _cell_value(value):
+    if value is None or value is pd.NaT:
+        return None
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class BatchWriter:
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class XlsxBatchWriter(BatchWriter):
+    """Appends batches using openpyxl's write-only mode.
+
+    Rows past Excel's per-sheet limit continue on Sheet1_2, Sheet1_3, ...
+    each with its own header row.
+    """
+
+    MAX_ROWS = 1048576
+
+    def __init__(self, path, sheet_name='Sheet1'):
+        import openpyxl
+
+        self.path = path
+        self.sheet_name = sheet_name
+        self.workbook = openpyxl.Workbook(write_only=True)
+        self.sheet = None
+        self.sheet_rows = 0
+        self.columns = None
+
+    def _new_sheet(self):
+        count = len(self.workbook.worksheets)
+        title = self.sheet_name if count == 0 else f'{self.sheet_name}_{count + 1}'
+        self.sheet = self.workbook.create_sheet(title)
+        self.sheet.append(self.columns)
+        self.sheet_rows = 1
+
+    def write(self, df):
+        if self.columns is None:
+            self.columns = list(df.columns)
+            self._new_sheet()
+        for row in df[self.columns].itertuples(index=False, name=None):
+            if self.sheet_rows >= self.MAX_ROWS:
+                self._new_sheet()
+            self.sheet.append([_cell_value(v) for v in row])
+            self.sheet_rows += 1
+
+    def close(self):
+        self.workbook.save(self.path)
+
+
+class CsvBatchWriter(BatchWriter):
+
+    def __init__(self, path):
+        self.path = path
+        self.handle = open(path, 'w', newline='', encoding='utf-8')
+        self.columns = None
+
+    def write(self, df):
+        if self.columns is None:
+            self.columns = list(df.columns)
+            df.head(0).to_csv(self.handle, index=False)
+        df[self.columns].to_csv(self.handle, header=False, index=False)
+
+    def close(self):
+        self.handle.close()
+
+
+class ParquetBatchWriter(BatchWriter):
+    """Writes each batch as its own row group under one fixed schema.
+
+    Workbook columns use PARQUET_COLUMN_TYPES; any other column takes the
+    type inferred from the first batch, with all-null columns widened to
+    string.
+    """
+
+    def __init__(self, path):
+        _require_pyarrow()
+        self.path = path
+        self.writer = None
+        self.schema = None
+
+    def _normalize(self, df):
+        df = df.copy()
+        for col in df.columns:
+            kind = PARQUET_COLUMN_TYPES.get(col)
+            if kind == 'float':
+                df[col] = pd.to_numeric(df[col], errors='coerce').astype('float64')
+            elif kind == 'int':
+                df[col] = pd.to_numeric(df[col], errors='coerce').astype('Int64')
+            elif kind == 'string' or df[col].dtype == object:
+                df[col] = df[col].map(lambda v: None if _cell_value(v) is None else str(v))
+        return df
+
+    def _build_schema(self, df):
+        import pyarrow as pa
+
+        arrow_types = {'string': pa.string(), 'float': pa.float64(), 'int': pa.int64()}
+        inferred = pa.Schema.from_pandas(df, preserve_index=False)
+        fields = []
+        for field in inferred:
+            kind = PARQUET_COLUMN_TYPES.get(field.name)
+            if kind is not None:
+                field = pa.field(field.name, arrow_types[kind])
+            elif pa.types.is_null(field.type):
+                field = pa.field(field.name, pa.string())
+            fields.append(field)
+        return pa.schema(fields)
+
+    def write(self, df):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        df = self._normalize(df)
+        if self.writer is None:
+            self.schema = self._build_schema(df)
+            self.writer = pq.ParquetWriter(self.path, self.schema)
+        self.writer.write_table(pa.Table.from_pandas(df, schema=self.schema, preserve_index=False))
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def open_writer(path):
+    writers = {
+        'xlsx': XlsxBatchWriter,
+        'csv': CsvBatchWriter,
+        'parquet': ParquetBatchWriter,
+    }
+    return writers[detect_format(path)](path)
@@ -0,0 +1,73 @@
+"""Measure streaming export throughput (rows/s) and peak RSS across output sizes.
+
+Run from the repository root:
+    python benchmarks/bench_export.py [--rows 4400 100000 1000000] [--formats csv parquet xlsx]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Each run gets a fresh interpreter so ru_maxrss reflects that run alone.
+# Input is the workbook tiled up to the requested row count, generated lazily.
+CHILD = """
+import json, resource, sys, time, warnings
+warnings.simplefilter('ignore')
+sys.path.insert(0, {root!r})
+import pandas as pd
+import scoring
+from model_io import load_model
+
+model = load_model()
+base = pd.read_excel('loan_applications_fraud_4400.xlsx')
+
+def batches(total, batch_size):
+    emitted = 0
+    while emitted < total:
+        batch = base.iloc[:min(batch_size, total - emitted)].copy()
+        batch['ApplicationID'] = batch['ApplicationID'] + '_' + str(emitted)
+        emitted += len(batch)
+        yield batch
+
+start_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+rows = scoring.score_batches(model, batches({rows}, {batch_size}), {output!r})
+elapsed = time.perf_counter() - start
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{'rows_per_s': rows / elapsed, 'start_rss_mb': start_rss / 1024, 'peak_rss_mb': peak / 1024}}))
+"""
+
+
+def run(rows, fmt, batch_size, workdir):
+    output = os.path.join(workdir, f'scored_{rows}.{fmt}')
+    code = CHILD.format(root=ROOT, rows=rows, batch_size=batch_size, output=output)
+    out = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True,
+                         capture_output=True, text=True).stdout
+    stats = json.loads(out.strip().splitlines()[-1])
+    stats['size_mb'] = os.path.getsize(output) / 2**20
+    os.remove(output)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[4400, 100000, 1000000])
+    parser.add_argument('--formats', nargs='+', default=['csv', 'parquet', 'xlsx'])
+    parser.add_argument('--batch-size', type=int, default=4400)
+    args = parser.parse_args()
+
+    print(f"{'format':<9}{'rows':>10}{'rows/s':>10}{'base MB':>10}{'peak MB':>10}{'file MB':>10}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for fmt in args.formats:
+            for rows in args.rows:
+                s = run(rows, fmt, args.batch_size, workdir)
+                print(f"{fmt:<9}{rows:>10}{s['rows_per_s']:>10.0f}{s['start_rss_mb']:>10.1f}"
+                      f"{s['peak_rss_mb']:>10.1f}{s['size_mb']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Compare load time, artifact size and resident memory of the native vs. pickled model.
+
+Run from the repository root:
+    python benchmarks/bench_model_load.py [--repeat 20]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import model_io
+
+# Each loader runs in a fresh interpreter so import cost and peak RSS are not shared.
+CHILD = """
+import json, resource, sys, time, warnings
+warnings.simplefilter('ignore')
+sys.path.insert(0, {root!r})
+import pandas, numpy, xgboost, joblib, sklearn
+import model_io
+base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+for _ in range({repeat}):
+    model = model_io.{loader}()
+elapsed = (time.perf_counter() - start) / {repeat}
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{'load_ms': elapsed * 1000, 'rss_delta_kb': peak - base}}))
+"""
+
+
+def run_loader(loader, repeat):
+    code = CHILD.format(root=ROOT, loader=loader, repeat=repeat)
+    out = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True,
+                         capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    rows = [
+        ('native (ubj)', 'load_native', model_io.NATIVE_MODEL_PATH),
+        ('legacy (pickle)', 'load_legacy', model_io.LEGACY_MODEL_PATH),
+    ]
+    print(f"{'artifact':<18}{'size KiB':>10}{'load ms':>10}{'RSS +KiB':>10}")
+    for label, loader, path in rows:
+        stats = run_loader(loader, args.repeat)
+        size_kib = os.path.getsize(path) / 1024
+        print(f"{label:<18}{size_kib:>10.1f}{stats['load_ms']:>10.2f}{stats['rss_delta_kb']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Measure sustained throughput of the streaming consumer against a stated target.
+
+Run from the repository root:
+    python benchmarks/bench_stream.py [--events 100000] [--target 5000]
+"""
+import argparse
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+warnings.simplefilter('ignore')
+
+from model_io import load_model
+import stream
+import synth
+
+
+def write_events(path, events, seed):
+    profile = synth.fit_profile()
+    with open(path, 'w', encoding='utf-8') as fh:
+        for batch in synth.iter_synthetic_batches(profile, events, 50000, seed):
+            fh.write(batch.to_json(orient='records', lines=True, date_format='iso', force_ascii=False))
+            fh.write('\n')
+
+
+def run_jsonl(model, events_path, workdir, args):
+    consumer = stream.StreamConsumer(
+        stream.JsonlFileSource(events_path, follow=False),
+        stream.JsonlDecisionSink(os.path.join(workdir, 'jsonl_decisions.jsonl')),
+        os.path.join(workdir, 'jsonl.checkpoint'),
+        model=model, batch_size=args.batch_size, queue_size=args.queue_size,
+    )
+    start = time.perf_counter()
+    processed = consumer.run()
+    return processed, time.perf_counter() - start
+
+
+def run_socket(model, events_path, workdir, args):
+    sock_path = os.path.join(workdir, 'events.sock')
+    consumer = stream.StreamConsumer(
+        stream.UnixSocketSource(sock_path),
+        stream.JsonlDecisionSink(os.path.join(workdir, 'socket_decisions.jsonl')),
+        os.path.join(workdir, 'socket.checkpoint'),
+        model=model, batch_size=args.batch_size, queue_size=args.queue_size,
+    )
+    runner = threading.Thread(target=consumer.run)
+    runner.start()
+    while not os.path.exists(sock_path):
+        time.sleep(0.01)
+
+    start = time.perf_counter()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client, open(events_path, 'rb') as fh:
+        client.connect(sock_path)
+        for line in fh:
+            client.sendall(line)
+    while consumer.checkpoint['events'] < args.events:
+        time.sleep(0.01)
+    elapsed = time.perf_counter() - start
+    consumer.stop()
+    runner.join()
+    return consumer.checkpoint['events'], elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--events', type=int, default=100000)
+    parser.add_argument('--target', type=float, default=5000, help="Required events/s")
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--queue-size', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    model = load_model()
+    with tempfile.TemporaryDirectory() as workdir:
+        events_path = os.path.join(workdir, 'events.jsonl')
+        write_events(events_path, args.events, args.seed)
+
+        print(f"target: {args.target:,.0f} events/s")
+        print(f"{'source':<10}{'events':>10}{'seconds':>10}{'events/s':>12}{'':>6}")
+        for name, runner in (('jsonl', run_jsonl), ('socket', run_socket)):
+            processed, elapsed = runner(model, events_path, workdir, args)
+            rate = processed / elapsed
+            verdict = 'ok' if rate >= args.target else 'BELOW'
+            print(f"{name:<10}{processed:>10}{elapsed:>10.2f}{rate:>12,.0f}{verdict:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Measure synthetic generation throughput in memory and when written to each format.
+
+Run from the repository root:
+    python benchmarks/bench_synth.py [--rows 1000000] [--formats csv parquet]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+warnings.simplefilter('ignore')
+
+from batch_io import open_writer
+import synth
+
+
+def timed(profile, rows, chunk_size, seed, output=None):
+    start = time.perf_counter()
+    batches = synth.iter_synthetic_batches(profile, rows, chunk_size, seed)
+    if output is None:
+        for _ in batches:
+            pass
+    else:
+        with open_writer(output) as writer:
+            for batch in batches:
+                writer.write(batch)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--chunk-size', type=int, default=100000)
+    parser.add_argument('--formats', nargs='+', default=['csv', 'parquet'])
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    start = time.perf_counter()
+    profile = synth.fit_profile()
+    print(f"profile fit: {time.perf_counter() - start:.2f}s")
+
+    print(f"{'target':<10}{'rows':>10}{'seconds':>10}{'rows/min':>14}")
+    elapsed = timed(profile, args.rows, args.chunk_size, args.seed)
+    print(f"{'memory':<10}{args.rows:>10}{elapsed:>10.2f}{args.rows / elapsed * 60:>14,.0f}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for fmt in args.formats:
+            elapsed = timed(profile, args.rows, args.chunk_size, args.seed, os.path.join(workdir, f'synth.{fmt}'))
+            print(f"{fmt:<10}{args.rows:>10}{elapsed:>10.2f}{args.rows / elapsed * 60:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
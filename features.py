@@ -0,0 +1,187 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+# ==============================
+# Feature Layout
+# ==============================
+FEATURE_COLUMNS = [
+    'ApplicationID',
+    'Names ClientName',
+    'Incident Start Date',
+    'Total Amounts',
+    'Complaint Date',
+    'Account Opening Date',
+    'Date of Last Password Change',
+    'Date of Last Phone Number Change',
+    'Phone Number',
+    'Email',
+    'E-Services Login Session ID',
+    'Login Channel',
+    'Trusted Device Status',
+    'Product Type',
+    'Login IP Address',
+    'Login GPS Latitude',
+    'Login GPS Longitude',
+    'Login GPS Country',
+]
+LABEL_COLUMN = 'Fraud_Flag'
+EPOCH = pd.Timestamp(0)
+
+# Relative to the application (incident) time, so features do not drift as the clock moves.
+TIME_DELTA_COLUMNS = [
+    'Account Age Days',
+    'Hours Since Password Change',
+    'Hours Since Phone Change',
+    'Complaint Lag Hours',
+]
+
+DATE_COLUMNS = [
+    'Incident Start Date',
+    'Complaint Date',
+    'Account Opening Date',
+    'Date of Last Password Change',
+    'Date of Last Phone Number Change',
+]
+HASHED_COLUMNS = [
+    'ApplicationID',
+    'Names ClientName',
+    'Email',
+    'E-Services Login Session ID',
+    'Login IP Address',
+    'Login GPS Country',
+]
+# Per-application identifiers: unique per row, so they carry no signal and let
+# the model memorise the training set.
+IDENTIFIER_COLUMNS = [
+    'ApplicationID',
+    'Names ClientName',
+    'Email',
+    'E-Services Login Session ID',
+]
+# Inputs of the current model: absolute dates are replaced by their deltas.
+MODEL_COLUMNS = [
+    col for col in FEATURE_COLUMNS if col not in DATE_COLUMNS and col not in IDENTIFIER_COLUMNS
+] + TIME_DELTA_COLUMNS
+
+# Label-encoded in sorted order, as at training time. Unknown labels map to -1.
+CATEGORY_LEVELS = {
+    'Login Channel': ['ATM', 'Branch Terminal', 'Mobile App', 'Phone Banking', 'Tablet App', 'Web'],
+    'Trusted Device Status': ['Newly Registered', 'Not Trusted', 'Pending Verification', 'Trusted'],
+    'Product Type': ['Credit Card', 'Personal Finance', 'Retail Finance'],
+}
+
+
+# ==============================
+# Scalar Encoders
+# ==============================
+def hash_to_int(value):
+    if value is None:
+        return 0
+    return int(hashlib.md5(str(value).encode()).hexdigest()[:8], 16) % 1000000
+
+
+# ==============================
+# Batch Encoders
+# ==============================
+def _to_datetime(values):
+    """Parse dates onto one naive-UTC basis.
+
+    Zoned values (``...Z``, ``+03:00``) are converted to UTC, naive values
+    are taken as UTC, and numbers are read as epoch seconds.
+    """
+    values = pd.Series(values)
+    if isinstance(values.dtype, pd.DatetimeTZDtype):
+        return values.dt.tz_convert('UTC').dt.tz_localize(None)
+    if pd.api.types.is_datetime64_dtype(values):
+        return values
+    if pd.api.types.is_bool_dtype(values):
+        values = values.astype(object)
+    if pd.api.types.is_numeric_dtype(values):
+        return pd.to_datetime(values, unit='s', errors='coerce')
+
+    # Only object columns that really mix numbers with other values need the per-cell check.
+    kind = pd.api.types.infer_dtype(values, skipna=True)
+    if kind in ('integer', 'floating', 'mixed-integer-float', 'decimal'):
+        return pd.to_datetime(pd.to_numeric(values, errors='coerce'), unit='s', errors='coerce')
+    if kind in ('string', 'datetime', 'datetime64', 'date', 'empty'):
+        return pd.to_datetime(values, errors='coerce', format='mixed', utc=True).dt.tz_localize(None)
+    numeric = values.map(lambda v: isinstance(v, (int, float, np.number)) and not isinstance(v, bool)).astype(bool)
+    parsed = pd.to_datetime(values.mask(numeric), errors='coerce', format='mixed', utc=True).dt.tz_localize(None)
+    if numeric.any():
+        parsed[numeric] = pd.to_datetime(values[numeric].astype(np.float64), unit='s', errors='coerce')
+    return parsed
+
+def hash_series(values):
+    """Vectorized hash_to_int: each distinct value is hashed once per batch."""
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    hashed = np.fromiter((hash_to_int(v) for v in uniques), dtype=np.int64, count=len(uniques))
+    return np.append(hashed, 0)[codes]
+
+def datetime_series(values):
+    """Epoch seconds with naive values read as UTC, 0 for missing or unparseable values."""
+    ts = _to_datetime(values)
+    seconds = (ts - EPOCH) // pd.Timedelta(seconds=1)
+    return seconds.fillna(0).to_numpy(dtype=np.int64)
+
+def category_series(values, levels):
+    return pd.Categorical(values, categories=levels).codes.astype(np.int64)
+
+def _compute_time_deltas(raw):
+    applied = _to_datetime(raw['Incident Start Date'])
+    hour = pd.Timedelta(hours=1)
+    return pd.DataFrame({
+        'Account Age Days': (applied - _to_datetime(raw['Account Opening Date'])) / pd.Timedelta(days=1),
+        'Hours Since Password Change': (applied - _to_datetime(raw['Date of Last Password Change'])) / hour,
+        'Hours Since Phone Change': (applied - _to_datetime(raw['Date of Last Phone Number Change'])) / hour,
+        'Complaint Lag Hours': (_to_datetime(raw['Complaint Date']) - applied) / hour,
+    }, index=raw.index)
+
+def add_time_deltas(raw):
+    """Attach TIME_DELTA_COLUMNS to a batch of raw rows.
+
+    Rows whose deltas are all present are kept as-is, so callers derive them
+    once and pass the enriched record along instead of recomputing. Rows
+    with any missing delta (including batches where only some rows carry
+    the columns) are derived from their dates.
+    """
+    if all(col in raw.columns for col in TIME_DELTA_COLUMNS):
+        pending = raw[TIME_DELTA_COLUMNS].isna().any(axis=1).to_numpy()
+        if not pending.any():
+            return raw
+    else:
+        pending = np.ones(len(raw), dtype=bool)
+    if pending.all():
+        return raw.assign(**_compute_time_deltas(raw))
+
+    out = raw.copy()
+    deltas = _compute_time_deltas(raw[pending])
+    for col in TIME_DELTA_COLUMNS:
+        out[col] = pd.to_numeric(out[col], errors='coerce').astype(np.float64)
+        out.loc[pending, col] = deltas[col].to_numpy()
+    return out
+
+def encode_batch(raw, feature_names=None):
+    """Encode a batch of raw workbook rows into model features.
+
+    Only the columns in feature_names are built, so the raw date encodings
+    are computed only for a model that uses them (the legacy pickle). By
+    default every raw and delta feature is emitted.
+    """
+    raw = add_time_deltas(raw)
+    columns = list(feature_names) if feature_names is not None else FEATURE_COLUMNS + TIME_DELTA_COLUMNS
+    out = {}
+    for col in columns:
+        series = raw[col]
+        if col in TIME_DELTA_COLUMNS:
+            out[col] = series.to_numpy(dtype=np.float64)
+        elif col in DATE_COLUMNS:
+            out[col] = datetime_series(series)
+        elif col in HASHED_COLUMNS:
+            out[col] = hash_series(series)
+        elif col in CATEGORY_LEVELS:
+            out[col] = category_series(series, CATEGORY_LEVELS[col])
+        else:
+            out[col] = pd.to_numeric(series, errors='coerce').to_numpy()
+    return pd.DataFrame(out, index=raw.index, columns=columns)
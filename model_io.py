@@ -0,0 +1,150 @@
+import hashlib
+import json
+import logging
+import os
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# ==============================
+# Artifact Locations
+# ==============================
+NATIVE_MODEL_PATH = 'Final_model.ubj'
+SCHEMA_PATH = 'Final_model.schema.json'
+LEGACY_MODEL_PATH = 'Final_model.pkl'
+
+# Bump whenever features.py changes how raw fields are encoded, so an artifact
+# trained on the old encoding is refused instead of silently misread.
+# 2: absolute dates replaced by time deltas (features.TIME_DELTA_COLUMNS).
+ENCODER_VERSION = 2
+SCHEMA_VERSION = 1
+
+
+class ModelLoadError(Exception):
+    pass
+
+
+# ==============================
+# Model Wrapper
+# ==============================
+class FraudModel:
+    """Uniform predict interface over a native Booster or a legacy sklearn wrapper."""
+
+    def __init__(self, estimator, feature_names, source):
+        self.estimator = estimator
+        self.feature_names = list(feature_names)
+        self.source = source
+
+    def predict_proba(self, df):
+        X = df[self.feature_names]
+        if self.source == 'native':
+            return np.asarray(self.estimator.inplace_predict(X), dtype=np.float64)
+        return np.asarray(self.estimator.predict_proba(X)[:, 1], dtype=np.float64)
+
+    def predict(self, df, threshold=0.5):
+        return (self.predict_proba(df) > threshold).astype(np.int64)
+
+
+# ==============================
+# Schema Manifest
+# ==============================
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_schema(booster, model_path):
+    return {
+        'schema_version': SCHEMA_VERSION,
+        'encoder_version': ENCODER_VERSION,
+        'model_file': os.path.basename(model_path),
+        'format': 'ubj' if model_path.endswith('.ubj') else 'json',
+        'sha256': file_sha256(model_path),
+        'feature_names': list(booster.feature_names),
+        'feature_types': list(booster.feature_types),
+        'objective': json.loads(booster.save_config())['learner']['objective']['name'],
+    }
+
+
+def read_schema(schema_path=SCHEMA_PATH):
+    with open(schema_path, 'r', encoding='utf-8') as fh:
+        schema = json.load(fh)
+    if schema.get('schema_version') != SCHEMA_VERSION:
+        raise ModelLoadError(f"Unsupported schema version {schema.get('schema_version')!r} in {schema_path}")
+    if schema.get('encoder_version') != ENCODER_VERSION:
+        raise ModelLoadError(
+            f"Model was built for encoder version {schema.get('encoder_version')!r}, "
+            f"this code uses {ENCODER_VERSION}"
+        )
+    return schema
+
+
+# ==============================
+# Export
+# ==============================
+def save_native(booster, model_path=NATIVE_MODEL_PATH, schema_path=SCHEMA_PATH):
+    """Write a booster in native format together with its schema manifest."""
+    booster.save_model(model_path)
+    schema = build_schema(booster, model_path)
+    with open(schema_path, 'w', encoding='utf-8') as fh:
+        json.dump(schema, fh, indent=2)
+        fh.write('\n')
+    return schema
+
+def export_native(legacy_path=LEGACY_MODEL_PATH, model_path=NATIVE_MODEL_PATH, schema_path=SCHEMA_PATH):
+    """Convert the pickled XGBClassifier into a native booster file plus schema manifest."""
+    import joblib
+
+    return save_native(joblib.load(legacy_path).get_booster(), model_path, schema_path)
+
+
+# ==============================
+# Load
+# ==============================
+def load_native(model_path=NATIVE_MODEL_PATH, schema_path=SCHEMA_PATH, verify_checksum=True):
+    import xgboost as xgb
+
+    schema = read_schema(schema_path)
+    if verify_checksum and file_sha256(model_path) != schema['sha256']:
+        raise ModelLoadError(f"Checksum mismatch for {model_path}")
+
+    booster = xgb.Booster()
+    booster.load_model(model_path)
+    if list(booster.feature_names or []) != schema['feature_names']:
+        raise ModelLoadError(f"Feature order in {model_path} does not match {schema_path}")
+    if list(booster.feature_types or []) != schema['feature_types']:
+        raise ModelLoadError(f"Feature types in {model_path} do not match {schema_path}")
+    return FraudModel(booster, schema['feature_names'], 'native')
+
+
+def load_legacy(legacy_path=LEGACY_MODEL_PATH):
+    import joblib
+
+    estimator = joblib.load(legacy_path)
+    return FraudModel(estimator, estimator.feature_names_in_, 'legacy')
+
+
+def load_model(model_path=NATIVE_MODEL_PATH, schema_path=SCHEMA_PATH, legacy_path=LEGACY_MODEL_PATH):
+    """Load the native booster, falling back to the legacy pickle if it is missing or invalid."""
+    if os.path.exists(model_path) and os.path.exists(schema_path):
+        try:
+            return load_native(model_path, schema_path)
+        except (ModelLoadError, ImportError, OSError, ValueError, KeyError) as exc:
+            logger.warning("Native model load failed (%s); falling back to %s", exc, legacy_path)
+    else:
+        logger.warning("Native model not found at %s; falling back to %s", model_path, legacy_path)
+
+    try:
+        return load_legacy(legacy_path)
+    except Exception as exc:
+        raise ModelLoadError(f"Could not load model from {model_path} or {legacy_path}: {exc}") from exc
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    schema = export_native()
+    logger.info("Wrote %s and %s (sha256 %s)", NATIVE_MODEL_PATH, SCHEMA_PATH, schema['sha256'])
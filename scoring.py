@@ -0,0 +1,89 @@
+import argparse
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from batch_io import iter_batches, open_writer
+from features import add_time_deltas, encode_batch
+from model_io import load_model
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLD = 0.5
+PROBABILITY_COLUMN = 'Fraud_Probability'
+DECISION_COLUMN = 'Decision'
+REASON_COLUMN = 'Reason'
+PASS = 'Pass'
+REFER = 'Refer to Human'
+
+
+# ==============================
+# Referral Reasons
+# ==============================
+def reason_flags(derived):
+    """Boolean risk indicators matching the checks shown on the verification page."""
+    return {
+        'New account': derived['Account Age Days'] < 90,
+        'Recent password change': derived['Hours Since Password Change'] <= 7 * 24,
+        'Recent phone number change': derived['Hours Since Phone Change'] <= 7 * 24,
+        'Untrusted device': derived['Trusted Device Status'] != 'Trusted',
+        'Login outside Saudi Arabia': ~derived['Login GPS Country'].astype(str).str.contains('Saudi Arabia', regex=False),
+        'High amount': pd.to_numeric(derived['Total Amounts'], errors='coerce') > 100000,
+    }
+
+def build_reasons(derived, referred):
+    reasons = np.full(len(derived), '', dtype=object)
+    for label, flag in reason_flags(derived).items():
+        hit = flag.to_numpy(dtype=bool, na_value=False) & referred
+        reasons[hit] = np.where(reasons[hit] == '', label, reasons[hit] + '; ' + label)
+    return reasons
+
+
+# ==============================
+# Scoring
+# ==============================
+def score_batch(model, raw, threshold=DEFAULT_THRESHOLD):
+    """Return raw rows with probability, decision and reason columns appended."""
+    derived = add_time_deltas(raw)
+    probability = model.predict_proba(encode_batch(derived, model.feature_names))
+    referred = probability > threshold
+    scored = raw.copy()
+    scored[PROBABILITY_COLUMN] = probability.round(6)
+    scored[DECISION_COLUMN] = np.where(referred, REFER, PASS)
+    scored[REASON_COLUMN] = build_reasons(derived, referred)
+    return scored
+
+def score_batches(model, batches, output_path, threshold=DEFAULT_THRESHOLD):
+    """Score an iterable of raw batches, writing each one out before the next is read."""
+    rows = 0
+    with open_writer(output_path) as writer:
+        for raw in batches:
+            writer.write(score_batch(model, raw, threshold))
+            rows += len(raw)
+    return rows
+
+def score_file(input_path, output_path, batch_size=10000, threshold=DEFAULT_THRESHOLD, model=None):
+    """Stream input_path through the model and write results batch by batch."""
+    model = model or load_model()
+    return score_batches(model, iter_batches(input_path, batch_size), output_path, threshold)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk re-screen loan applications.")
+    parser.add_argument('input', help="Input .xlsx, .csv or .parquet in the workbook layout")
+    parser.add_argument('output', help="Output .xlsx, .csv or .parquet")
+    parser.add_argument('--batch-size', type=int, default=10000)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    start = time.perf_counter()
+    rows = score_file(args.input, args.output, args.batch_size, args.threshold)
+    elapsed = time.perf_counter() - start
+    logger.info("Scored %d rows in %.1fs (%.0f rows/s) -> %s", rows, elapsed, rows / elapsed, args.output)
+
+
+if __name__ == "__main__":
+    main()
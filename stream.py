@@ -0,0 +1,434 @@
+import argparse
+import json
+import logging
+import os
+import queue
+import signal
+import socket
+import stat
+import sys
+import threading
+import time
+
+import pandas as pd
+
+from features import FEATURE_COLUMNS
+from model_io import load_model
+from scoring import DEFAULT_THRESHOLD, DECISION_COLUMN, PROBABILITY_COLUMN, REASON_COLUMN, score_batch
+
+logger = logging.getLogger(__name__)
+
+_EOF = object()
+
+
+class SourceError(Exception):
+    pass
+
+
+class _SourceFailure:
+    """Queued in place of _EOF when a source thread dies, carrying the cause."""
+
+    def __init__(self, exc):
+        self.exc = exc
+
+
+# ==============================
+# Sources
+# ==============================
+class JsonlFileSource:
+    """Tails a JSONL file of application events.
+
+    Offsets are byte positions just past each complete line, so a restart
+    seeks straight to the first unconsumed event. When following, a trailing
+    line without a newline is treated as still being written and is left for
+    the next poll; with follow=False it is read as the final event.
+    """
+
+    replayable = True
+
+    def __init__(self, path, follow=True, poll_interval=0.2):
+        self.path = path
+        self.follow = follow
+        self.poll_interval = poll_interval
+
+    def run(self, out, start_offset, stop):
+        with open(self.path, 'rb') as fh:
+            fh.seek(start_offset)
+            offset = start_offset
+            while not stop.is_set():
+                line = fh.readline()
+                if line.endswith(b'\n'):
+                    offset += len(line)
+                    if line.strip():
+                        _put(out, (offset, line), stop)
+                    continue
+                if not self.follow:
+                    # Nothing else will write the file, so an unterminated tail is the last event.
+                    if line.strip():
+                        offset += len(line)
+                        _put(out, (offset, line), stop)
+                    break
+                fh.seek(offset)
+                time.sleep(self.poll_interval)
+        _put(out, _EOF, stop)
+
+
+class UnixSocketSource:
+    """Accepts newline-delimited JSON events on a local Unix socket.
+
+    Offsets are event counts. A socket cannot be replayed, so on restart
+    senders must resend anything they sent after the last checkpoint.
+    While the queue is full nothing is read, so the socket buffer fills and
+    senders block; that is how backpressure reaches them.
+    """
+
+    replayable = False
+
+    def __init__(self, path):
+        self.path = path
+
+    def _clear_stale_socket(self):
+        """Remove a socket left by a dead consumer; refuse to touch anything else."""
+        try:
+            mode = os.lstat(self.path).st_mode
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(mode):
+            raise FileExistsError(f"{self.path} exists and is not a socket")
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            pass
+        else:
+            raise FileExistsError(f"Another process is already listening on {self.path}")
+        finally:
+            probe.close()
+        os.unlink(self.path)
+
+    def run(self, out, start_offset, stop):
+        self._clear_stale_socket()
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(self.path)
+        bound = os.lstat(self.path)
+        server.listen()
+        server.settimeout(0.5)
+        counter = [start_offset]
+        lock = threading.Lock()
+        try:
+            while not stop.is_set():
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    continue
+                threading.Thread(target=self._serve, args=(conn, out, counter, lock, stop), daemon=True).start()
+        finally:
+            server.close()
+            # Only remove the path if it is still the socket bound above.
+            try:
+                current = os.lstat(self.path)
+            except FileNotFoundError:
+                current = None
+            if current is not None and (current.st_dev, current.st_ino) == (bound.st_dev, bound.st_ino):
+                os.unlink(self.path)
+        _put(out, _EOF, stop)
+
+    def _serve(self, conn, out, counter, lock, stop):
+        with conn, conn.makefile('rb') as reader:
+            for line in reader:
+                if stop.is_set():
+                    break
+                if not line.strip():
+                    continue
+                # Count and enqueue under one lock so offsets reach the queue in order.
+                with lock:
+                    counter[0] += 1
+                    _put(out, (counter[0], line), stop)
+
+
+def _run_source(source, out, start_offset, stop):
+    try:
+        source.run(out, start_offset, stop)
+    except Exception as exc:
+        logger.exception("Event source %s failed", type(source).__name__)
+        _put(out, _SourceFailure(exc), stop)
+
+def _put(out, item, stop):
+    while not stop.is_set():
+        try:
+            out.put(item, timeout=0.5)
+            return
+        except queue.Full:
+            continue
+
+
+# ==============================
+# Sink & Checkpoint
+# ==============================
+DECISION_FIELDS = ['ApplicationID', PROBABILITY_COLUMN, DECISION_COLUMN, REASON_COLUMN]
+
+
+class JsonlSink:
+    """Append-only JSONL file whose size is checkpointed so partial writes can be rolled back."""
+
+    def __init__(self, path):
+        self.path = path
+        self.handle = open(path, 'ab')
+
+    def position(self):
+        self.handle.flush()
+        return self.handle.tell()
+
+    def truncate(self, size):
+        self.handle.flush()
+        self.handle.truncate(size)
+        self.handle.seek(size)
+
+    def _append(self, payload):
+        self.handle.write(payload.encode('utf-8'))
+        if not payload.endswith('\n'):
+            self.handle.write(b'\n')
+        self.handle.flush()
+        os.fsync(self.handle.fileno())
+
+    def close(self):
+        self.handle.close()
+
+
+class JsonlDecisionSink(JsonlSink):
+    """One decision per line."""
+
+    def write(self, scored):
+        self._append(scored[DECISION_FIELDS].to_json(orient='records', lines=True, force_ascii=False))
+
+
+class JsonlRejectedSink(JsonlSink):
+    """Dead-letter file: one rejected event per line with its offset and the reason."""
+
+    def write(self, rejected):
+        self._append('\n'.join(
+            json.dumps({'offset': offset, 'error': error, 'event': line.decode('utf-8', 'replace').rstrip('\n')},
+                       ensure_ascii=False)
+            for offset, line, error in rejected
+        ))
+
+
+def read_checkpoint(path):
+    if not os.path.exists(path):
+        return {'source_offset': 0, 'sink_offset': None, 'rejected_offset': None, 'events': 0}
+    with open(path, 'r', encoding='utf-8') as fh:
+        return json.load(fh)
+
+def write_checkpoint(path, checkpoint):
+    tmp = f'{path}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as fh:
+        json.dump(checkpoint, fh)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, path)
+
+
+# ==============================
+# Consumer
+# ==============================
+class StreamConsumer:
+    """Micro-batches events from a source through the model into a sink.
+
+    A bounded queue sits between the source thread and the scorer. Each
+    batch is written and fsynced to the sink before its checkpoint is
+    replaced. On start the sink is cut back to the checkpointed size, which
+    drops decisions written after the last checkpoint; their events are then
+    read again from the source. Replayable sources are therefore never
+    rescored past a checkpoint and never produce duplicate decisions.
+
+    Events that cannot be parsed or scored go to the optional rejected sink
+    and still advance the checkpoint, so one bad event cannot stall the
+    stream. If the source thread dies, run() raises SourceError.
+    """
+
+    def __init__(self, source, sink, checkpoint_path, model=None, batch_size=500, max_wait=0.2,
+                 queue_size=10000, threshold=DEFAULT_THRESHOLD, rejected_sink=None):
+        self.source = source
+        self.sink = sink
+        self.rejected_sink = rejected_sink
+        self.checkpoint_path = checkpoint_path
+        self.model = model or load_model()
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.threshold = threshold
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.stop_event = threading.Event()
+        self.checkpoint = read_checkpoint(checkpoint_path)
+        self.rejected = 0
+
+    def stop(self, *_):
+        self.stop_event.set()
+
+    def _next_batch(self):
+        """Collect up to batch_size events, waiting at most max_wait after the first one."""
+        events, deadline, finished, failure = [], None, False, None
+        while len(events) < self.batch_size:
+            timeout = 0.5 if deadline is None else deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                if deadline is None and self.stop_event.is_set():
+                    finished = True
+                    break
+                continue
+            if item is _EOF:
+                finished = True
+                break
+            if isinstance(item, _SourceFailure):
+                finished, failure = True, item.exc
+                break
+            events.append(item)
+            if deadline is None:
+                deadline = time.monotonic() + self.max_wait
+        return events, finished, failure
+
+    def _parse(self, events):
+        """Split events into parseable (offset, line, record) triples and rejections."""
+        parsed, rejected = [], []
+        for offset, line in events:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            if not isinstance(record, dict):
+                rejected.append((offset, line, 'invalid JSON object'))
+                continue
+            missing = [col for col in FEATURE_COLUMNS if col not in record]
+            if missing:
+                rejected.append((offset, line, f'missing fields: {missing}'))
+                continue
+            parsed.append((offset, line, record))
+        return parsed, rejected
+
+    def _score(self, parsed):
+        """Score the batch at once; if that fails, fall back to one event at a time."""
+        frame = pd.DataFrame.from_records([record for _, _, record in parsed])
+        try:
+            return [score_batch(self.model, frame, self.threshold)], []
+        except Exception as exc:
+            logger.warning("Batch of %d events failed to score (%s); retrying one by one", len(parsed), exc)
+
+        scored, rejected = [], []
+        for offset, line, record in parsed:
+            try:
+                scored.append(score_batch(self.model, pd.DataFrame.from_records([record]), self.threshold))
+            except Exception as exc:
+                rejected.append((offset, line, f'{type(exc).__name__}: {exc}'))
+        return scored, rejected
+
+    def _reject(self, rejected):
+        self.rejected += len(rejected)
+        for offset, line, error in rejected:
+            logger.warning("Rejected event at offset %s (%s): %r", offset, error, line[:200])
+        if self.rejected_sink is not None:
+            self.rejected_sink.write(rejected)
+
+    def _process(self, events):
+        parsed, rejected = self._parse(events)
+        if parsed:
+            scored, failed = self._score(parsed)
+            rejected += failed
+            if scored:
+                self.sink.write(pd.concat(scored, ignore_index=True))
+        if rejected:
+            self._reject(rejected)
+        self.checkpoint = {
+            'source_offset': events[-1][0],
+            'sink_offset': self.sink.position(),
+            'rejected_offset': self.rejected_sink.position() if self.rejected_sink is not None else None,
+            'events': self.checkpoint['events'] + len(events),
+        }
+        write_checkpoint(self.checkpoint_path, self.checkpoint)
+
+    def _restore_sinks(self):
+        """Cut the sinks back to the checkpoint, or record their sizes if there is none yet.
+
+        Writing the first checkpoint before any event is read means a crash
+        before the first batch completes still rolls back cleanly on restart.
+        """
+        checkpoint = dict(self.checkpoint)
+        if checkpoint['sink_offset'] is None:
+            checkpoint['sink_offset'] = self.sink.position()
+        else:
+            self.sink.truncate(checkpoint['sink_offset'])
+        if self.rejected_sink is not None:
+            if checkpoint.get('rejected_offset') is None:
+                checkpoint['rejected_offset'] = self.rejected_sink.position()
+            else:
+                self.rejected_sink.truncate(checkpoint['rejected_offset'])
+        if checkpoint != self.checkpoint:
+            self.checkpoint = checkpoint
+            write_checkpoint(self.checkpoint_path, self.checkpoint)
+
+    def run(self):
+        self._restore_sinks()
+        start_offset = self.checkpoint['source_offset'] if self.source.replayable else self.checkpoint['events']
+        reader = threading.Thread(target=_run_source, args=(self.source, self.queue, start_offset, self.stop_event),
+                                  daemon=True)
+        reader.start()
+
+        processed = 0
+        try:
+            while True:
+                events, finished, failure = self._next_batch()
+                if events:
+                    self._process(events)
+                    processed += len(events)
+                if failure is not None:
+                    raise SourceError(f"{type(self.source).__name__} failed: {failure}") from failure
+                if finished:
+                    break
+        finally:
+            self.stop_event.set()
+            reader.join(timeout=2)
+            self.sink.close()
+            if self.rejected_sink is not None:
+                self.rejected_sink.close()
+        return processed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Continuously score application events.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--jsonl', help="JSONL file of events to tail")
+    source.add_argument('--socket', help="Unix socket path to listen on")
+    parser.add_argument('--sink', required=True, help="JSONL file decisions are appended to")
+    parser.add_argument('--checkpoint', help="Checkpoint file (default: <sink>.checkpoint)")
+    parser.add_argument('--rejected', help="Dead-letter file for rejected events (default: <sink>.rejected)")
+    parser.add_argument('--no-follow', action='store_true', help="Stop at end of the JSONL file instead of tailing it")
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--max-wait', type=float, default=0.2, help="Max seconds a partial batch waits")
+    parser.add_argument('--queue-size', type=int, default=10000)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    src = JsonlFileSource(args.jsonl, follow=not args.no_follow) if args.jsonl else UnixSocketSource(args.socket)
+    consumer = StreamConsumer(
+        src, JsonlDecisionSink(args.sink), args.checkpoint or f'{args.sink}.checkpoint',
+        batch_size=args.batch_size, max_wait=args.max_wait, queue_size=args.queue_size, threshold=args.threshold,
+        rejected_sink=JsonlRejectedSink(args.rejected or f'{args.sink}.rejected'),
+    )
+    signal.signal(signal.SIGINT, consumer.stop)
+    signal.signal(signal.SIGTERM, consumer.stop)
+
+    start = time.perf_counter()
+    try:
+        processed = consumer.run()
+    except SourceError as exc:
+        logger.error("%s", exc)
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+    logger.info("Scored %d events in %.1fs (%.0f events/s, %d rejected)",
+                processed, elapsed, processed / elapsed if elapsed else 0, consumer.rejected)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+import argparse
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from batch_io import iter_batches, open_writer
+from features import FEATURE_COLUMNS, LABEL_COLUMN
+
+logger = logging.getLogger(__name__)
+
+SOURCE_PATH = 'loan_applications_fraud_4400.xlsx'
+OUTPUT_COLUMNS = FEATURE_COLUMNS + [LABEL_COLUMN]
+
+# Day offsets relative to the incident date, resampled jointly so their correlations survive.
+OFFSET_COLUMNS = [
+    'Complaint Date',
+    'Account Opening Date',
+    'Date of Last Password Change',
+    'Date of Last Phone Number Change',
+]
+CATEGORICAL_COLUMNS = ['Names ClientName', 'Login Channel', 'Trusted Device Status', 'Product Type']
+PLUS_CODE_ALPHABET = np.array(list('23456789CFGHJMPQRVWX'))
+
+
+# ==============================
+# Profile Fitting
+# ==============================
+def _frequencies(series):
+    counts = series.value_counts()
+    return counts.index.to_numpy(dtype=object), (counts / counts.sum()).to_numpy()
+
+def _reuse(series):
+    """Share of rows whose value also appears on another row, and mean rows per shared value."""
+    counts = series.value_counts()
+    shared = counts[counts > 1]
+    rate = shared.sum() / len(series) if len(series) else 0.0
+    return float(rate), float(shared.mean()) if len(shared) else 2.0
+
+def fit_class_profile(df):
+    incident = pd.to_datetime(df['Incident Start Date'], errors='coerce', format='mixed').dt.normalize()
+    offsets = np.column_stack([
+        (pd.to_datetime(df[col], errors='coerce', format='mixed').dt.normalize() - incident).dt.days
+        for col in OFFSET_COLUMNS
+    ])
+    valid = ~np.isnan(offsets).any(axis=1) & incident.notna().to_numpy()
+
+    log_amount = np.log(df['Total Amounts'].astype(float).clip(lower=1.0))
+    email = df['Email'].astype(str)
+    location = df['Login GPS Country'].astype(str).str.split(' ', n=1).str[1]
+    gps = pd.DataFrame({
+        'location': location,
+        'lat': df['Login GPS Latitude'].astype(float),
+        'lon': df['Login GPS Longitude'].astype(float),
+    }).groupby('location').agg(['mean', 'std']).fillna(0.0)
+
+    return {
+        'incident_days': incident[valid].to_numpy(dtype='datetime64[D]'),
+        'offsets': offsets[valid].astype(np.int64),
+        'amount_log_mean': float(log_amount.mean()),
+        'amount_log_std': float(log_amount.std()),
+        'amount_range': (float(df['Total Amounts'].min()), float(df['Total Amounts'].max())),
+        'categorical': {col: _frequencies(df[col]) for col in CATEGORICAL_COLUMNS},
+        'location': _frequencies(location),
+        'gps': gps,
+        'phone_prefix': _frequencies(df['Phone Number'].astype(str).str[:3]),
+        'email_prefix': _frequencies(email.str.extract(r'^([a-z]+)')[0].fillna('user')),
+        'email_domain': _frequencies(email.str.split('@').str[1].fillna('gmail.com')),
+        'email_reuse': _reuse(email),
+        'ip_first_octet': _frequencies(df['Login IP Address'].astype(str).str.split('.').str[0].astype(int)),
+        'ip_reuse': _reuse(df['Login IP Address']),
+    }
+
+def fit_profile(path=SOURCE_PATH):
+    """Learn per-class marginals and joint date offsets from a labelled workbook."""
+    df = pd.concat(iter_batches(path), ignore_index=True)
+    return {
+        'fraud_rate': float(df[LABEL_COLUMN].mean()),
+        'classes': {label: fit_class_profile(df[df[LABEL_COLUMN] == label]) for label in (0, 1)},
+    }
+
+
+# ==============================
+# Vectorized Sampling
+# ==============================
+def _choice(rng, freq, n):
+    values, probs = freq
+    return values[rng.choice(len(values), size=n, p=probs)]
+
+def _join(*parts):
+    """Element-wise string concatenation of arrays and scalar separators."""
+    n = max(len(part) for part in parts if not isinstance(part, str))
+    out = pd.Series(np.full(n, '', dtype=object))
+    for part in parts:
+        out = out + (part if isinstance(part, str) else pd.Series(part).astype(str).to_numpy())
+    return out.to_numpy(dtype=object)
+
+def _with_reuse(rng, fresh, reuse):
+    """Collapse a share of rows onto a small pool of values to mimic reused emails / IPs."""
+    rate, group_size = reuse
+    reused = np.flatnonzero(rng.random(len(fresh)) < rate)
+    if len(reused) > 1:
+        pool = reused[:max(1, int(round(len(reused) / group_size)))]
+        fresh[reused] = fresh[rng.choice(pool, size=len(reused))]
+    return fresh
+
+def sample_class(profile, row_ids, rng):
+    n = len(row_ids)
+
+    incident = profile['incident_days'][rng.integers(0, len(profile['incident_days']), n)]
+    offsets = profile['offsets'][rng.integers(0, len(profile['offsets']), n)]
+    dates = {
+        col: (incident + offsets[:, i].astype('timedelta64[D]')).astype('datetime64[ns]')
+        for i, col in enumerate(OFFSET_COLUMNS)
+    }
+
+    low, high = profile['amount_range']
+    amounts = np.exp(rng.normal(profile['amount_log_mean'], profile['amount_log_std'], n))
+    amounts = np.clip(amounts, low, high).round(2)
+
+    location = _choice(rng, profile['location'], n)
+    gps = profile['gps'].reindex(location)
+    lat = rng.normal(gps[('lat', 'mean')].to_numpy(), gps[('lat', 'std')].to_numpy())
+    lon = rng.normal(gps[('lon', 'mean')].to_numpy(), gps[('lon', 'std')].to_numpy())
+    plus_code = PLUS_CODE_ALPHABET[rng.integers(0, len(PLUS_CODE_ALPHABET), (n, 7))]
+    plus_code = _join(*(plus_code[:, i] for i in range(4)), '+', *(plus_code[:, i] for i in range(4, 7)))
+
+    phone = _choice(rng, profile['phone_prefix'], n).astype(np.int64) * 1000000 + rng.integers(0, 1000000, n)
+    email = _join(_choice(rng, profile['email_prefix'], n), '_', row_ids, '@', _choice(rng, profile['email_domain'], n))
+    ip = _join(
+        _choice(rng, profile['ip_first_octet'], n), '.', rng.integers(0, 256, n), '.',
+        rng.integers(0, 256, n), '.', rng.integers(1, 255, n),
+    )
+
+    incident_stamp = pd.DatetimeIndex(incident.astype('datetime64[ns]'))
+    return pd.DataFrame({
+        'ApplicationID': _join('RTL_', incident_stamp.strftime('%y%m%d'), '_', pd.Series(row_ids).astype(str).str.zfill(4)),
+        'Names ClientName': _choice(rng, profile['categorical']['Names ClientName'], n),
+        'Incident Start Date': incident_stamp,
+        'Total Amounts': amounts,
+        'Complaint Date': dates['Complaint Date'],
+        'Account Opening Date': dates['Account Opening Date'],
+        'Date of Last Password Change': dates['Date of Last Password Change'],
+        'Date of Last Phone Number Change': dates['Date of Last Phone Number Change'],
+        'Phone Number': phone,
+        'Email': _with_reuse(rng, email, profile['email_reuse']),
+        'E-Services Login Session ID': _join('SES_', rng.integers(100000000, 1000000000, n)),
+        'Login Channel': _choice(rng, profile['categorical']['Login Channel'], n),
+        'Trusted Device Status': _choice(rng, profile['categorical']['Trusted Device Status'], n),
+        'Product Type': _choice(rng, profile['categorical']['Product Type'], n),
+        'Login IP Address': _with_reuse(rng, ip, profile['ip_reuse']),
+        'Login GPS Latitude': lat.round(6),
+        'Login GPS Longitude': lon.round(6),
+        'Login GPS Country': _join(plus_code, ' ', location),
+    }, index=row_ids)
+
+def generate_batch(profile, n, rng, start_index=0):
+    """Sample n labelled rows in the workbook layout."""
+    labels = (rng.random(n) < profile['fraud_rate']).astype(np.int64)
+    parts = []
+    for label in (0, 1):
+        idx = np.flatnonzero(labels == label)
+        if len(idx):
+            part = sample_class(profile['classes'][label], start_index + idx, rng)
+            part[LABEL_COLUMN] = label
+            parts.append(part)
+    return pd.concat(parts).sort_index().reset_index(drop=True)[OUTPUT_COLUMNS]
+
+def iter_synthetic_batches(profile, rows, chunk_size=100000, seed=0):
+    """Yield chunks of synthetic rows; the same seed and chunk_size reproduce the same data."""
+    for chunk, start in enumerate(range(0, rows, chunk_size)):
+        rng = np.random.default_rng([seed, chunk])
+        yield generate_batch(profile, min(chunk_size, rows - start), rng, start)
+
+def generate_file(output_path, rows, chunk_size=100000, seed=0, source_path=SOURCE_PATH):
+    profile = fit_profile(source_path)
+    with open_writer(output_path) as writer:
+        for batch in iter_synthetic_batches(profile, rows, chunk_size, seed):
+            writer.write(batch)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic labelled loan applications.")
+    parser.add_argument('output', help="Output .xlsx, .csv or .parquet")
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--chunk-size', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--source', default=SOURCE_PATH, help="Labelled workbook to learn the profile from")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    start = time.perf_counter()
+    rows = generate_file(args.output, args.rows, args.chunk_size, args.seed, args.source)
+    elapsed = time.perf_counter() - start
+    logger.info("Generated %d rows in %.1fs (%.0f rows/min) -> %s", rows, elapsed, rows / elapsed * 60, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import argparse
+import logging
+
+import numpy as np
+import pandas as pd
+
+from batch_io import iter_batches
+from features import LABEL_COLUMN, MODEL_COLUMNS, encode_batch
+from model_io import NATIVE_MODEL_PATH, SCHEMA_PATH, save_native
+
+logger = logging.getLogger(__name__)
+
+TRAINING_PATH = 'loan_applications_fraud_4400.xlsx'
+MODEL_PARAMS = {
+    'n_estimators': 100,
+    'max_depth': 6,
+    'learning_rate': 0.1,
+    'eval_metric': 'logloss',
+    'random_state': 42,
+}
+
+
+def load_training_data(path=TRAINING_PATH, batch_size=10000):
+    """Run the labelled file through the same feature pipeline used for scoring."""
+    features, labels = [], []
+    for raw in iter_batches(path, batch_size):
+        features.append(encode_batch(raw, MODEL_COLUMNS))
+        labels.append(raw[LABEL_COLUMN].to_numpy(dtype=np.int64))
+    return pd.concat(features, ignore_index=True), np.concatenate(labels)
+
+def train(path=TRAINING_PATH, test_size=0.2, model_path=NATIVE_MODEL_PATH, schema_path=SCHEMA_PATH):
+    from sklearn.metrics import accuracy_score, roc_auc_score
+    from sklearn.model_selection import train_test_split
+    from xgboost import XGBClassifier
+
+    X, y = load_training_data(path)
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=test_size, stratify=y, random_state=MODEL_PARAMS['random_state']
+    )
+    clf = XGBClassifier(**MODEL_PARAMS)
+    clf.fit(X_train, y_train)
+
+    proba = clf.predict_proba(X_test)[:, 1]
+    metrics = {
+        'accuracy': accuracy_score(y_test, proba > 0.5),
+        'roc_auc': roc_auc_score(y_test, proba),
+    }
+    logger.info("Holdout accuracy %.4f, ROC-AUC %.4f", metrics['accuracy'], metrics['roc_auc'])
+
+    save_native(clf.get_booster(), model_path, schema_path)
+    logger.info("Wrote %s and %s", model_path, schema_path)
+    return metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the fraud model and export it in native format.")
+    parser.add_argument('--data', default=TRAINING_PATH)
+    parser.add_argument('--test-size', type=float, default=0.2)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    train(args.data, args.test_size)
+
+
+if __name__ == "__main__":
+    main()